@@ -100,7 +100,7 @@ def _convmixer(arch, dim, depth, kernel_size=9, patch_size=7, activation=nn.GELU
         ), "{} model do not have a pretrained model now, you should set pretrained=False".format(arch)
         weight_path = get_weights_path_from_url(model_urls[arch][0], model_urls[arch][1])
 
-        param = paddle.load(weight_path)
+        param = paddle.load(weight_path, return_numpy=True)
         model.set_dict(param)
 
     return model
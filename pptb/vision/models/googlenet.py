@@ -228,6 +228,6 @@ def googlenet(pretrained=False, **kwargs):
         ), "{} model do not have a pretrained model now, you should set pretrained=False".format(arch)
         weight_path = get_weights_path_from_url(model_urls[arch][0], model_urls[arch][1])
 
-        param = paddle.load(weight_path)
+        param = paddle.load(weight_path, return_numpy=True)
         model.set_dict(param)
     return model
@@ -16,8 +16,9 @@ import math
 
 import paddle
 import paddle.nn as nn
+import paddle.nn.functional as F
 from paddle.fluid.param_attr import ParamAttr
-from paddle.nn import AdaptiveAvgPool2D, AvgPool2D, BatchNorm, Conv2D, Dropout, Linear, MaxPool2D
+from paddle.nn import AdaptiveAvgPool2D, BatchNorm2D, Conv2D, Dropout, Linear, MaxPool2D
 from paddle.nn.initializer import Uniform
 from paddle.utils.download import get_weights_path_from_url
 
@@ -34,7 +35,9 @@ model_urls = {
 
 
 class ConvBNLayer(nn.Layer):
-    def __init__(self, num_channels, num_filters, filter_size, stride=1, padding=0, groups=1, act="relu"):
+    def __init__(
+        self, num_channels, num_filters, filter_size, stride=1, padding=0, groups=1, act="relu", data_format="NCHW"
+    ):
         super().__init__()
         self.act = act
         self.conv = Conv2D(
@@ -45,28 +48,50 @@ class ConvBNLayer(nn.Layer):
             padding=padding,
             groups=groups,
             bias_attr=False,
+            data_format=data_format,
         )
-        self.bn = BatchNorm(num_filters)
-        self.relu = nn.ReLU()
+        self.bn = BatchNorm2D(num_filters, data_format=data_format)
 
     def forward(self, x):
         x = self.conv(x)
         x = self.bn(x)
-        if self.act:
-            x = self.relu(x)
+        if self.act == "relu":
+            x = F.relu(x)
         return x
 
+    @paddle.no_grad()
+    def fuse(self):
+        # already fused
+        if isinstance(self.bn, nn.Identity):
+            return
+        # W' = W * gamma / sqrt(var + eps), b' = beta - mean * gamma / sqrt(var + eps)
+        scale = self.bn.weight / paddle.sqrt(self.bn._variance + self.bn._epsilon)
+        self.conv.weight.set_value(self.conv.weight * scale.reshape([-1, 1, 1, 1]))
+        self.conv.bias = self.conv.create_parameter(shape=[self.conv._out_channels], is_bias=True)
+        self.conv.bias.set_value(self.bn.bias - self.bn._mean * scale)
+        self.bn = nn.Identity()
+
 
 class InceptionStem(nn.Layer):
-    def __init__(self):
+    def __init__(self, data_format="NCHW"):
         super().__init__()
-        self.conv_1a_3x3 = ConvBNLayer(num_channels=3, num_filters=32, filter_size=3, stride=2, act="relu")
-        self.conv_2a_3x3 = ConvBNLayer(num_channels=32, num_filters=32, filter_size=3, stride=1, act="relu")
-        self.conv_2b_3x3 = ConvBNLayer(num_channels=32, num_filters=64, filter_size=3, padding=1, act="relu")
+        self.conv_1a_3x3 = ConvBNLayer(
+            num_channels=3, num_filters=32, filter_size=3, stride=2, act="relu", data_format=data_format
+        )
+        self.conv_2a_3x3 = ConvBNLayer(
+            num_channels=32, num_filters=32, filter_size=3, stride=1, act="relu", data_format=data_format
+        )
+        self.conv_2b_3x3 = ConvBNLayer(
+            num_channels=32, num_filters=64, filter_size=3, padding=1, act="relu", data_format=data_format
+        )
 
-        self.max_pool = MaxPool2D(kernel_size=3, stride=2, padding=0)
-        self.conv_3b_1x1 = ConvBNLayer(num_channels=64, num_filters=80, filter_size=1, act="relu")
-        self.conv_4a_3x3 = ConvBNLayer(num_channels=80, num_filters=192, filter_size=3, act="relu")
+        self.max_pool = MaxPool2D(kernel_size=3, stride=2, padding=0, data_format=data_format)
+        self.conv_3b_1x1 = ConvBNLayer(
+            num_channels=64, num_filters=80, filter_size=1, act="relu", data_format=data_format
+        )
+        self.conv_4a_3x3 = ConvBNLayer(
+            num_channels=80, num_filters=192, filter_size=3, act="relu", data_format=data_format
+        )
 
     def forward(self, x):
         x = self.conv_1a_3x3(x)
@@ -80,18 +105,31 @@ class InceptionStem(nn.Layer):
 
 
 class InceptionA(nn.Layer):
-    def __init__(self, num_channels, pool_features):
+    def __init__(self, num_channels, pool_features, data_format="NCHW"):
         super().__init__()
-        self.branch1x1 = ConvBNLayer(num_channels=num_channels, num_filters=64, filter_size=1, act="relu")
-        self.branch5x5_1 = ConvBNLayer(num_channels=num_channels, num_filters=48, filter_size=1, act="relu")
-        self.branch5x5_2 = ConvBNLayer(num_channels=48, num_filters=64, filter_size=5, padding=2, act="relu")
-
-        self.branch3x3dbl_1 = ConvBNLayer(num_channels=num_channels, num_filters=64, filter_size=1, act="relu")
-        self.branch3x3dbl_2 = ConvBNLayer(num_channels=64, num_filters=96, filter_size=3, padding=1, act="relu")
-        self.branch3x3dbl_3 = ConvBNLayer(num_channels=96, num_filters=96, filter_size=3, padding=1, act="relu")
-        self.branch_pool = AvgPool2D(kernel_size=3, stride=1, padding=1, exclusive=False)
+        self.data_format = data_format
+        self.channel_axis = 1 if data_format == "NCHW" else -1
+        self.branch1x1 = ConvBNLayer(
+            num_channels=num_channels, num_filters=64, filter_size=1, act="relu", data_format=data_format
+        )
+        self.branch5x5_1 = ConvBNLayer(
+            num_channels=num_channels, num_filters=48, filter_size=1, act="relu", data_format=data_format
+        )
+        self.branch5x5_2 = ConvBNLayer(
+            num_channels=48, num_filters=64, filter_size=5, padding=2, act="relu", data_format=data_format
+        )
+
+        self.branch3x3dbl_1 = ConvBNLayer(
+            num_channels=num_channels, num_filters=64, filter_size=1, act="relu", data_format=data_format
+        )
+        self.branch3x3dbl_2 = ConvBNLayer(
+            num_channels=64, num_filters=96, filter_size=3, padding=1, act="relu", data_format=data_format
+        )
+        self.branch3x3dbl_3 = ConvBNLayer(
+            num_channels=96, num_filters=96, filter_size=3, padding=1, act="relu", data_format=data_format
+        )
         self.branch_pool_conv = ConvBNLayer(
-            num_channels=num_channels, num_filters=pool_features, filter_size=1, act="relu"
+            num_channels=num_channels, num_filters=pool_features, filter_size=1, act="relu", data_format=data_format
         )
 
     def forward(self, x):
@@ -103,20 +141,29 @@ class InceptionA(nn.Layer):
         branch3x3dbl = self.branch3x3dbl_2(branch3x3dbl)
         branch3x3dbl = self.branch3x3dbl_3(branch3x3dbl)
 
-        branch_pool = self.branch_pool(x)
+        branch_pool = F.avg_pool2d(x, kernel_size=3, stride=1, padding=1, exclusive=False, data_format=self.data_format)
         branch_pool = self.branch_pool_conv(branch_pool)
-        x = paddle.concat([branch1x1, branch5x5, branch3x3dbl, branch_pool], axis=1)
+        x = paddle.concat([branch1x1, branch5x5, branch3x3dbl, branch_pool], axis=self.channel_axis)
         return x
 
 
 class InceptionB(nn.Layer):
-    def __init__(self, num_channels):
+    def __init__(self, num_channels, data_format="NCHW"):
         super().__init__()
-        self.branch3x3 = ConvBNLayer(num_channels=num_channels, num_filters=384, filter_size=3, stride=2, act="relu")
-        self.branch3x3dbl_1 = ConvBNLayer(num_channels=num_channels, num_filters=64, filter_size=1, act="relu")
-        self.branch3x3dbl_2 = ConvBNLayer(num_channels=64, num_filters=96, filter_size=3, padding=1, act="relu")
-        self.branch3x3dbl_3 = ConvBNLayer(num_channels=96, num_filters=96, filter_size=3, stride=2, act="relu")
-        self.branch_pool = MaxPool2D(kernel_size=3, stride=2)
+        self.data_format = data_format
+        self.channel_axis = 1 if data_format == "NCHW" else -1
+        self.branch3x3 = ConvBNLayer(
+            num_channels=num_channels, num_filters=384, filter_size=3, stride=2, act="relu", data_format=data_format
+        )
+        self.branch3x3dbl_1 = ConvBNLayer(
+            num_channels=num_channels, num_filters=64, filter_size=1, act="relu", data_format=data_format
+        )
+        self.branch3x3dbl_2 = ConvBNLayer(
+            num_channels=64, num_filters=96, filter_size=3, padding=1, act="relu", data_format=data_format
+        )
+        self.branch3x3dbl_3 = ConvBNLayer(
+            num_channels=96, num_filters=96, filter_size=3, stride=2, act="relu", data_format=data_format
+        )
 
     def forward(self, x):
         branch3x3 = self.branch3x3(x)
@@ -125,20 +172,29 @@ class InceptionB(nn.Layer):
         branch3x3dbl = self.branch3x3dbl_2(branch3x3dbl)
         branch3x3dbl = self.branch3x3dbl_3(branch3x3dbl)
 
-        branch_pool = self.branch_pool(x)
+        branch_pool = F.max_pool2d(x, kernel_size=3, stride=2, data_format=self.data_format)
 
-        x = paddle.concat([branch3x3, branch3x3dbl, branch_pool], axis=1)
+        x = paddle.concat([branch3x3, branch3x3dbl, branch_pool], axis=self.channel_axis)
 
         return x
 
 
 class InceptionC(nn.Layer):
-    def __init__(self, num_channels, channels_7x7):
+    def __init__(self, num_channels, channels_7x7, data_format="NCHW"):
         super().__init__()
-        self.branch1x1 = ConvBNLayer(num_channels=num_channels, num_filters=192, filter_size=1, act="relu")
+        self.data_format = data_format
+        self.channel_axis = 1 if data_format == "NCHW" else -1
+        self.branch1x1 = ConvBNLayer(
+            num_channels=num_channels, num_filters=192, filter_size=1, act="relu", data_format=data_format
+        )
 
         self.branch7x7_1 = ConvBNLayer(
-            num_channels=num_channels, num_filters=channels_7x7, filter_size=1, stride=1, act="relu"
+            num_channels=num_channels,
+            num_filters=channels_7x7,
+            filter_size=1,
+            stride=1,
+            act="relu",
+            data_format=data_format,
         )
         self.branch7x7_2 = ConvBNLayer(
             num_channels=channels_7x7,
@@ -147,29 +203,57 @@ class InceptionC(nn.Layer):
             stride=1,
             padding=(0, 3),
             act="relu",
+            data_format=data_format,
         )
         self.branch7x7_3 = ConvBNLayer(
-            num_channels=channels_7x7, num_filters=192, filter_size=(7, 1), stride=1, padding=(3, 0), act="relu"
+            num_channels=channels_7x7,
+            num_filters=192,
+            filter_size=(7, 1),
+            stride=1,
+            padding=(3, 0),
+            act="relu",
+            data_format=data_format,
         )
 
         self.branch7x7dbl_1 = ConvBNLayer(
-            num_channels=num_channels, num_filters=channels_7x7, filter_size=1, act="relu"
+            num_channels=num_channels, num_filters=channels_7x7, filter_size=1, act="relu", data_format=data_format
         )
         self.branch7x7dbl_2 = ConvBNLayer(
-            num_channels=channels_7x7, num_filters=channels_7x7, filter_size=(7, 1), padding=(3, 0), act="relu"
+            num_channels=channels_7x7,
+            num_filters=channels_7x7,
+            filter_size=(7, 1),
+            padding=(3, 0),
+            act="relu",
+            data_format=data_format,
         )
         self.branch7x7dbl_3 = ConvBNLayer(
-            num_channels=channels_7x7, num_filters=channels_7x7, filter_size=(1, 7), padding=(0, 3), act="relu"
+            num_channels=channels_7x7,
+            num_filters=channels_7x7,
+            filter_size=(1, 7),
+            padding=(0, 3),
+            act="relu",
+            data_format=data_format,
         )
         self.branch7x7dbl_4 = ConvBNLayer(
-            num_channels=channels_7x7, num_filters=channels_7x7, filter_size=(7, 1), padding=(3, 0), act="relu"
+            num_channels=channels_7x7,
+            num_filters=channels_7x7,
+            filter_size=(7, 1),
+            padding=(3, 0),
+            act="relu",
+            data_format=data_format,
         )
         self.branch7x7dbl_5 = ConvBNLayer(
-            num_channels=channels_7x7, num_filters=192, filter_size=(1, 7), padding=(0, 3), act="relu"
+            num_channels=channels_7x7,
+            num_filters=192,
+            filter_size=(1, 7),
+            padding=(0, 3),
+            act="relu",
+            data_format=data_format,
         )
 
-        self.branch_pool = AvgPool2D(kernel_size=3, stride=1, padding=1, exclusive=False)
-        self.branch_pool_conv = ConvBNLayer(num_channels=num_channels, num_filters=192, filter_size=1, act="relu")
+        self.branch_pool_conv = ConvBNLayer(
+            num_channels=num_channels, num_filters=192, filter_size=1, act="relu", data_format=data_format
+        )
 
     def forward(self, x):
         branch1x1 = self.branch1x1(x)
@@ -184,28 +268,37 @@ class InceptionC(nn.Layer):
         branch7x7dbl = self.branch7x7dbl_4(branch7x7dbl)
         branch7x7dbl = self.branch7x7dbl_5(branch7x7dbl)
 
-        branch_pool = self.branch_pool(x)
+        branch_pool = F.avg_pool2d(x, kernel_size=3, stride=1, padding=1, exclusive=False, data_format=self.data_format)
         branch_pool = self.branch_pool_conv(branch_pool)
 
-        x = paddle.concat([branch1x1, branch7x7, branch7x7dbl, branch_pool], axis=1)
+        x = paddle.concat([branch1x1, branch7x7, branch7x7dbl, branch_pool], axis=self.channel_axis)
 
         return x
 
 
 class InceptionD(nn.Layer):
-    def __init__(self, num_channels):
+    def __init__(self, num_channels, data_format="NCHW"):
         super().__init__()
-        self.branch3x3_1 = ConvBNLayer(num_channels=num_channels, num_filters=192, filter_size=1, act="relu")
-        self.branch3x3_2 = ConvBNLayer(num_channels=192, num_filters=320, filter_size=3, stride=2, act="relu")
-        self.branch7x7x3_1 = ConvBNLayer(num_channels=num_channels, num_filters=192, filter_size=1, act="relu")
+        self.data_format = data_format
+        self.channel_axis = 1 if data_format == "NCHW" else -1
+        self.branch3x3_1 = ConvBNLayer(
+            num_channels=num_channels, num_filters=192, filter_size=1, act="relu", data_format=data_format
+        )
+        self.branch3x3_2 = ConvBNLayer(
+            num_channels=192, num_filters=320, filter_size=3, stride=2, act="relu", data_format=data_format
+        )
+        self.branch7x7x3_1 = ConvBNLayer(
+            num_channels=num_channels, num_filters=192, filter_size=1, act="relu", data_format=data_format
+        )
         self.branch7x7x3_2 = ConvBNLayer(
-            num_channels=192, num_filters=192, filter_size=(1, 7), padding=(0, 3), act="relu"
+            num_channels=192, num_filters=192, filter_size=(1, 7), padding=(0, 3), act="relu", data_format=data_format
         )
         self.branch7x7x3_3 = ConvBNLayer(
-            num_channels=192, num_filters=192, filter_size=(7, 1), padding=(3, 0), act="relu"
+            num_channels=192, num_filters=192, filter_size=(7, 1), padding=(3, 0), act="relu", data_format=data_format
+        )
+        self.branch7x7x3_4 = ConvBNLayer(
+            num_channels=192, num_filters=192, filter_size=3, stride=2, act="relu", data_format=data_format
         )
-        self.branch7x7x3_4 = ConvBNLayer(num_channels=192, num_filters=192, filter_size=3, stride=2, act="relu")
-        self.branch_pool = MaxPool2D(kernel_size=3, stride=2)
 
     def forward(self, x):
         branch3x3 = self.branch3x3_1(x)
@@ -216,59 +309,102 @@ class InceptionD(nn.Layer):
         branch7x7x3 = self.branch7x7x3_3(branch7x7x3)
         branch7x7x3 = self.branch7x7x3_4(branch7x7x3)
 
-        branch_pool = self.branch_pool(x)
+        branch_pool = F.max_pool2d(x, kernel_size=3, stride=2, data_format=self.data_format)
 
-        x = paddle.concat([branch3x3, branch7x7x3, branch_pool], axis=1)
+        x = paddle.concat([branch3x3, branch7x7x3, branch_pool], axis=self.channel_axis)
         return x
 
 
 class InceptionE(nn.Layer):
-    def __init__(self, num_channels):
+    def __init__(self, num_channels, data_format="NCHW"):
         super().__init__()
-        self.branch1x1 = ConvBNLayer(num_channels=num_channels, num_filters=320, filter_size=1, act="relu")
-        self.branch3x3_1 = ConvBNLayer(num_channels=num_channels, num_filters=384, filter_size=1, act="relu")
+        self.data_format = data_format
+        self.channel_axis = 1 if data_format == "NCHW" else -1
+        self.branch1x1 = ConvBNLayer(
+            num_channels=num_channels, num_filters=320, filter_size=1, act="relu", data_format=data_format
+        )
+        self.branch3x3_1 = ConvBNLayer(
+            num_channels=num_channels, num_filters=384, filter_size=1, act="relu", data_format=data_format
+        )
         self.branch3x3_2a = ConvBNLayer(
-            num_channels=384, num_filters=384, filter_size=(1, 3), padding=(0, 1), act="relu"
+            num_channels=384, num_filters=384, filter_size=(1, 3), padding=(0, 1), act="relu", data_format=data_format
         )
         self.branch3x3_2b = ConvBNLayer(
-            num_channels=384, num_filters=384, filter_size=(3, 1), padding=(1, 0), act="relu"
+            num_channels=384, num_filters=384, filter_size=(3, 1), padding=(1, 0), act="relu", data_format=data_format
         )
 
-        self.branch3x3dbl_1 = ConvBNLayer(num_channels=num_channels, num_filters=448, filter_size=1, act="relu")
-        self.branch3x3dbl_2 = ConvBNLayer(num_channels=448, num_filters=384, filter_size=3, padding=1, act="relu")
+        self.branch3x3dbl_1 = ConvBNLayer(
+            num_channels=num_channels, num_filters=448, filter_size=1, act="relu", data_format=data_format
+        )
+        self.branch3x3dbl_2 = ConvBNLayer(
+            num_channels=448, num_filters=384, filter_size=3, padding=1, act="relu", data_format=data_format
+        )
         self.branch3x3dbl_3a = ConvBNLayer(
-            num_channels=384, num_filters=384, filter_size=(1, 3), padding=(0, 1), act="relu"
+            num_channels=384, num_filters=384, filter_size=(1, 3), padding=(0, 1), act="relu", data_format=data_format
         )
         self.branch3x3dbl_3b = ConvBNLayer(
-            num_channels=384, num_filters=384, filter_size=(3, 1), padding=(1, 0), act="relu"
+            num_channels=384, num_filters=384, filter_size=(3, 1), padding=(1, 0), act="relu", data_format=data_format
+        )
+        self.branch_pool_conv = ConvBNLayer(
+            num_channels=num_channels, num_filters=192, filter_size=1, act="relu", data_format=data_format
         )
-        self.branch_pool = AvgPool2D(kernel_size=3, stride=1, padding=1, exclusive=False)
-        self.branch_pool_conv = ConvBNLayer(num_channels=num_channels, num_filters=192, filter_size=1, act="relu")
 
     def forward(self, x):
         branch1x1 = self.branch1x1(x)
 
         branch3x3 = self.branch3x3_1(x)
-        branch3x3 = [
-            self.branch3x3_2a(branch3x3),
-            self.branch3x3_2b(branch3x3),
-        ]
-        branch3x3 = paddle.concat(branch3x3, axis=1)
+        branch3x3 = self._asymmetric_branch(branch3x3, self.branch3x3_2a, self.branch3x3_2b)
 
         branch3x3dbl = self.branch3x3dbl_1(x)
         branch3x3dbl = self.branch3x3dbl_2(branch3x3dbl)
-        branch3x3dbl = [
-            self.branch3x3dbl_3a(branch3x3dbl),
-            self.branch3x3dbl_3b(branch3x3dbl),
-        ]
-        branch3x3dbl = paddle.concat(branch3x3dbl, axis=1)
+        branch3x3dbl = self._asymmetric_branch(branch3x3dbl, self.branch3x3dbl_3a, self.branch3x3dbl_3b)
 
-        branch_pool = self.branch_pool(x)
+        branch_pool = F.avg_pool2d(x, kernel_size=3, stride=1, padding=1, exclusive=False, data_format=self.data_format)
         branch_pool = self.branch_pool_conv(branch_pool)
 
-        x = paddle.concat([branch1x1, branch3x3, branch3x3dbl, branch_pool], axis=1)
+        x = paddle.concat([branch1x1, branch3x3, branch3x3dbl, branch_pool], axis=self.channel_axis)
         return x
 
+    def _asymmetric_branch(self, x, conv_1x3, conv_3x1):
+        # conv_3x1 is None once the pair has been merged into conv_1x3 by fuse()
+        if conv_3x1 is None:
+            return conv_1x3(x)
+        return paddle.concat([conv_1x3(x), conv_3x1(x)], axis=self.channel_axis)
+
+    def fuse(self):
+        # should be called after the BatchNorm of every ConvBNLayer has been folded
+        if self.branch3x3_2b is None:
+            return
+        self.branch3x3_2a = _merge_asymmetric_convs(self.branch3x3_2a, self.branch3x3_2b)
+        self.branch3x3_2b = None
+        self.branch3x3dbl_3a = _merge_asymmetric_convs(self.branch3x3dbl_3a, self.branch3x3dbl_3b)
+        self.branch3x3dbl_3b = None
+
+
+@paddle.no_grad()
+def _merge_asymmetric_convs(conv_1x3, conv_3x1):
+    """
+    Merge a (1, 3) and a (3, 1) fused ConvBNLayer sharing the same input into a single 3x3 ConvBNLayer,
+    whose kernel is zero outside the cross. It costs 3x the MACs of the pair, and only saves a conv launch
+    and a concat, so it only pays off when inference is dispatch-bound, e.g. small batches on GPU.
+    """
+    merged = ConvBNLayer(
+        num_channels=conv_1x3.conv._in_channels,
+        num_filters=conv_1x3.conv._out_channels + conv_3x1.conv._out_channels,
+        filter_size=3,
+        padding=1,
+        act=conv_1x3.act,
+        data_format=conv_1x3.conv._data_format,
+    )
+    weight_1x3 = F.pad(conv_1x3.conv.weight, [0, 0, 1, 1])
+    weight_3x1 = F.pad(conv_3x1.conv.weight, [1, 1, 0, 0])
+    merged.conv.weight.set_value(paddle.concat([weight_1x3, weight_3x1], axis=0))
+    merged.conv.bias = merged.conv.create_parameter(shape=[merged.conv._out_channels], is_bias=True)
+    merged.conv.bias.set_value(paddle.concat([conv_1x3.conv.bias, conv_3x1.conv.bias], axis=0))
+    merged.bn = nn.Identity()
+    merged.eval()
+    return merged
+
 
 class InceptionV3(nn.Layer):
     """
@@ -277,6 +413,8 @@ class InceptionV3(nn.Layer):
         num_classes (int, optional): output dim of last fc layer. If num_classes <=0, last fc layer
                             will not be defined. Default: 1000.
         with_pool (bool, optional): use pool before the last fc layer or not. Default: True.
+        data_format (str, optional): data format of the input, "NCHW" or "NHWC". "NHWC" usually runs
+                            faster on Tensor Cores and oneDNN. Default: "NCHW".
 
     Examples:
         .. code-block:: python
@@ -285,9 +423,15 @@ class InceptionV3(nn.Layer):
             from paddle.vision.models import InceptionV3
 
             inception_v3 = InceptionV3()
+
+            # convert to a static graph to get rid of the python overhead in inference
+            inception_v3.eval()
+            inception_v3 = paddle.jit.to_static(
+                inception_v3, input_spec=[paddle.static.InputSpec([None, 3, 299, 299], "float32")]
+            )
     """
 
-    def __init__(self, num_classes=1000, with_pool=True):
+    def __init__(self, num_classes=1000, with_pool=True, data_format="NCHW"):
         super().__init__()
         self.num_classes = num_classes
         self.with_pool = with_pool
@@ -305,31 +449,34 @@ class InceptionV3(nn.Layer):
         inception_d_list = self.layers_config["inception_d"]
         inception_e_list = self.layers_config["inception_e"]
 
-        self.inception_stem = InceptionStem()
+        self.inception_stem = InceptionStem(data_format=data_format)
 
-        self.inception_block_list = nn.LayerList()
+        inception_block_list = []
         for i in range(len(inception_a_list[0])):
-            inception_a = InceptionA(inception_a_list[0][i], inception_a_list[1][i])
-            self.inception_block_list.append(inception_a)
+            inception_a = InceptionA(inception_a_list[0][i], inception_a_list[1][i], data_format=data_format)
+            inception_block_list.append(inception_a)
 
         for i in range(len(inception_b_list)):
-            inception_b = InceptionB(inception_b_list[i])
-            self.inception_block_list.append(inception_b)
+            inception_b = InceptionB(inception_b_list[i], data_format=data_format)
+            inception_block_list.append(inception_b)
 
         for i in range(len(inception_c_list[0])):
-            inception_c = InceptionC(inception_c_list[0][i], inception_c_list[1][i])
-            self.inception_block_list.append(inception_c)
+            inception_c = InceptionC(inception_c_list[0][i], inception_c_list[1][i], data_format=data_format)
+            inception_block_list.append(inception_c)
 
         for i in range(len(inception_d_list)):
-            inception_d = InceptionD(inception_d_list[i])
-            self.inception_block_list.append(inception_d)
+            inception_d = InceptionD(inception_d_list[i], data_format=data_format)
+            inception_block_list.append(inception_d)
 
         for i in range(len(inception_e_list)):
-            inception_e = InceptionE(inception_e_list[i])
-            self.inception_block_list.append(inception_e)
+            inception_e = InceptionE(inception_e_list[i], data_format=data_format)
+            inception_block_list.append(inception_e)
+
+        # Sequential keeps the same parameter names as LayerList, but runs all blocks in a single call
+        self.inception_block_list = nn.Sequential(*inception_block_list)
 
         if with_pool:
-            self.avg_pool = AdaptiveAvgPool2D(1)
+            self.avg_pool = AdaptiveAvgPool2D(1, data_format=data_format)
 
         if num_classes > 0:
             self.dropout = Dropout(p=0.2, mode="downscale_in_infer")
@@ -338,10 +485,36 @@ class InceptionV3(nn.Layer):
                 2048, num_classes, weight_attr=ParamAttr(initializer=Uniform(-stdv, stdv)), bias_attr=ParamAttr()
             )
 
+    @paddle.no_grad()
+    def fuse(self, merge_asymmetric=False):
+        """
+        Fold every BatchNorm into its preceding Conv2D, and the inference scaling of dropout into
+        the last fc layer, to speed up inference.
+        The model should be in eval mode, and it can not be trained any more after fusing.
+        Calling it again on a fused model does nothing.
+
+        Args:
+            merge_asymmetric (bool, optional): also merge each (1, 3) and (3, 1) conv pair of InceptionE
+                            into a single 3x3 conv. It triples the MACs of these convs to save a launch
+                            and a concat, which only helps dispatch-bound inference such as small batches
+                            on GPU, and is slower on CPU. Default: False.
+        """
+        for layer in self.sublayers():
+            if isinstance(layer, ConvBNLayer):
+                layer.fuse()
+        if merge_asymmetric:
+            for layer in self.sublayers():
+                if isinstance(layer, InceptionE):
+                    layer.fuse()
+
+        if self.num_classes > 0 and not isinstance(self.dropout, nn.Identity):
+            # dropout in "downscale_in_infer" mode multiplies the input by (1 - p) in eval mode
+            self.fc.weight.set_value(self.fc.weight * (1 - self.dropout.p))
+            self.dropout = nn.Identity()
+
     def forward(self, x):
         x = self.inception_stem(x)
-        for inception_block in self.inception_block_list:
-            x = inception_block(x)
+        x = self.inception_block_list(x)
 
         if self.with_pool:
             x = self.avg_pool(x)
@@ -381,6 +554,6 @@ def inception_v3(pretrained=False, **kwargs):
         ), "{} model do not have a pretrained model now, you should set pretrained=False".format(arch)
         weight_path = get_weights_path_from_url(model_urls[arch][0], model_urls[arch][1])
 
-        param = paddle.load(weight_path)
+        param = paddle.load(weight_path, return_numpy=True)
         model.set_dict(param)
     return model
@@ -14,7 +14,8 @@ from pptb.tools import (
     mixup_data,
     mixup_metric,
 )
-from pptb.vision.models import resnext50_32x4d
+
+_RNG = np.random.default_rng(0)
 
 
 class FakeModel(nn.Layer):
@@ -22,34 +23,84 @@ class FakeModel(nn.Layer):
         super().__init__()
         self.input_shape = input_shape
         self.output_shape = output_shape
+        self._output_reshape = [-1, *output_shape]
 
         self.flatten = nn.Flatten()
-        self.fc = nn.Linear(np.prod(input_shape), np.prod(output_shape))
+        self.fc = nn.Linear(int(np.prod(input_shape)), int(np.prod(output_shape)))
 
     def forward(self, x):
         x = self.flatten(x)
         x = self.fc(x)
-        x = paddle.reshape(x, shape=[x.shape[0], *self.output_shape])
+        x = paddle.reshape(x, shape=self._output_reshape)
         return x
 
 
+@pytest.fixture(scope="module")
+def fake_model_cache():
+    return {}
+
+
+@pytest.fixture(scope="module")
+def loss_function():
+    return paddle.nn.CrossEntropyLoss()
+
+
+def get_fake_model(cache, input_shape, output_shape):
+    # 相同 shape 的 FakeModel 在各个测试之间复用，避免重复初始化参数
+    key = (tuple(input_shape), tuple(output_shape))
+    if key not in cache:
+        cache[key] = FakeModel(input_shape, output_shape)
+    return cache[key]
+
+
+def assert_mix_invariants(data_mixed, labels_a, labels_b, data, labels):
+    # mix 前后数据与标签的 dtype 和 shape 应保持不变
+    data_dtype, data_shape = data.dtype, data.shape
+    labels_dtype, labels_shape = labels.dtype, labels.shape
+    assert data_mixed.dtype == data_dtype
+    assert labels_a.dtype == labels_b.dtype == labels_dtype
+    assert data_mixed.shape == data_shape
+    assert labels_a.shape == labels_b.shape == labels_shape
+
+
+def assert_cutmix_area(data_mixed: paddle.Tensor, data: paddle.Tensor, axes: Sequence[int], lam: float):
+    # cutmix 会把所有样本 axes 上的同一块连续区域替换为另一样本的数据，且该区域的占比不超过 1 - lam
+    changed = paddle.not_equal(data_mixed, data)
+    sample_axes = list(range(1, changed.ndim))
+    box_volume = 1
+    for axis in sample_axes:
+        if axis not in axes:
+            box_volume *= changed.shape[axis]
+            continue
+        # 只把每根 axis 上的投影拷贝回 host，避免整个 batch 的拷贝
+        other_axes = [i for i in range(changed.ndim) if i != axis]
+        indices = np.flatnonzero(paddle.any(changed, axis=other_axes).numpy())
+        if indices.size == 0:
+            # 裁剪区域为空，或者所有样本都和自己进行了 mix
+            return
+        assert indices[-1] - indices[0] + 1 == indices.size
+        box_volume *= indices.size
+    assert box_volume / np.prod(changed.shape[1:]) <= 1 - lam + 1e-6
+    # 每个样本要么和自己 mix 而未被修改，要么整块区域都被修改
+    changed_per_sample = paddle.sum(paddle.cast(changed, "int64"), axis=sample_axes).numpy()
+    assert np.isin(changed_per_sample, [0, box_volume]).all()
+
+
 @pytest.mark.parametrize("batch_size", [1, 10])
-def test_mixup(batch_size: int):
-    fake_inputs = paddle.to_tensor((np.random.random((batch_size, 3, 224, 224)) * 255).astype(np.float32))
-    fake_labels = paddle.to_tensor((np.random.random((batch_size, 1)).astype(np.int64)))
-    model = resnext50_32x4d()
+def test_mixup(batch_size: int, fake_model_cache, loss_function):
+    fake_inputs = paddle.uniform([batch_size, 3, 224, 224], dtype="float32", min=0.0, max=255.0)
+    num_classes = 10
+    fake_labels = paddle.randint(0, num_classes, shape=[batch_size, 1], dtype="int64")
+    model = get_fake_model(fake_model_cache, (3, 224, 224), (num_classes,))
     mixup_alpha = 0.2
-    loss_function = paddle.nn.CrossEntropyLoss()
 
     X_batch_mixed, y_batch_a, y_batch_b, lam = mixup_data(fake_inputs, fake_labels, mixup_alpha)
-    predicts = model(X_batch_mixed)
-    loss = mixup_criterion(loss_function, predicts, y_batch_a, y_batch_b, lam)
-    acc = mixup_metric(paddle.metric.accuracy, predicts, y_batch_a, y_batch_b, lam)
-
-    assert X_batch_mixed.dtype == fake_inputs.dtype
-    assert y_batch_a.dtype == y_batch_b.dtype == fake_labels.dtype
-    assert X_batch_mixed.shape == fake_inputs.shape
-    assert y_batch_a.shape == y_batch_b.shape == fake_labels.shape
+    with paddle.no_grad():
+        predicts = model(X_batch_mixed)
+        loss = mixup_criterion(loss_function, predicts, y_batch_a, y_batch_b, lam)
+        acc = mixup_metric(paddle.metric.accuracy, predicts, y_batch_a, y_batch_b, lam)
+
+    assert_mix_invariants(X_batch_mixed, y_batch_a, y_batch_b, fake_inputs, fake_labels)
     # TODO: 这里的测试还是有点问题
     # upper_bound = np.ceil(fake_inputs.numpy().max(axis=0))
     # lower_bound = np.floor(fake_inputs.numpy().min(axis=0))
@@ -63,28 +114,31 @@ def test_mixup(batch_size: int):
         (1, [3, 224, 224], [2, 3]),
         (10, [3, 224, 224], [2, 3]),
         (10, [1000, 25], [1]),
-        (10, [1000, 50, 100], [1, 2, 3]),
+        # 200 MB 的输入，在 CI 上跳过
+        pytest.param(10, [1000, 50, 100], [1, 2, 3], marks=pytest.mark.ci_skip),
     ],
 )
-def test_cutmix(batch_size: int, data_shape: Sequence[int], mix_axes: Sequence[int]):
+def test_cutmix(batch_size: int, data_shape: Sequence[int], mix_axes: Sequence[int], fake_model_cache, loss_function):
     num_classes = 1
-    fake_inputs = paddle.to_tensor(np.array(np.random.random((batch_size, *data_shape)), dtype=np.float32))
-    fake_labels = paddle.to_tensor(np.array(np.random.random((batch_size, num_classes)), dtype=np.int64))
-    model = FakeModel(data_shape, (num_classes,))
+    # 每个样本的取值落在互不相交的区间内，这样被替换的位置一定与原值不同
+    sample_offsets = 2 * paddle.arange(batch_size, dtype="float32").reshape([-1] + [1] * len(data_shape))
+    fake_inputs = paddle.uniform([batch_size, *data_shape], dtype="float32", min=0.0, max=1.0) + sample_offsets
+    fake_labels = paddle.randint(0, num_classes, shape=[batch_size, num_classes], dtype="int64")
+    model = get_fake_model(fake_model_cache, data_shape, (num_classes,))
     cutmix_alpha = 0.2
-    loss_function = paddle.nn.CrossEntropyLoss()
+    # cutmix_data 会原地修改输入，因此需要在 mix 前保存一份用于对比
+    fake_inputs_origin = fake_inputs.clone()
 
     X_batch_mixed, y_batch_a, y_batch_b, lam = cutmix_data(fake_inputs, fake_labels, cutmix_alpha, axes=mix_axes)
-    predicts = model(X_batch_mixed)
-    loss = cutmix_criterion(loss_function, predicts, y_batch_a, y_batch_b, lam)
-    acc = cutmix_metric(paddle.metric.accuracy, predicts, y_batch_a, y_batch_b, lam)
-
-    assert X_batch_mixed.dtype == fake_inputs.dtype
-    assert y_batch_a.dtype == y_batch_b.dtype == fake_labels.dtype
-    assert X_batch_mixed.shape == fake_inputs.shape
-    assert y_batch_a.shape == y_batch_b.shape == fake_labels.shape
-    keep_ratio = (X_batch_mixed.numpy() == fake_inputs.numpy()).sum().astype(np.float32) / np.prod(fake_inputs.shape)
+    with paddle.no_grad():
+        predicts = model(X_batch_mixed)
+        loss = cutmix_criterion(loss_function, predicts, y_batch_a, y_batch_b, lam)
+        acc = cutmix_metric(paddle.metric.accuracy, predicts, y_batch_a, y_batch_b, lam)
+
+    assert_mix_invariants(X_batch_mixed, y_batch_a, y_batch_b, fake_inputs, fake_labels)
+    keep_ratio = paddle.cast(paddle.equal(X_batch_mixed, fake_inputs_origin), "float32").mean().item()
     assert keep_ratio >= lam
+    assert_cutmix_area(X_batch_mixed, fake_inputs_origin, mix_axes, lam)
 
 
 @pytest.mark.parametrize(
@@ -98,44 +152,39 @@ def test_cutmix(batch_size: int, data_shape: Sequence[int], mix_axes: Sequence[i
         (False, 0, 1),
     ],
 )
-def test_mixing_data_controller(is_numpy: bool, mixup_prob: float, cutmix_prob: float):
+def test_mixing_data_controller(is_numpy: bool, mixup_prob: float, cutmix_prob: float, fake_model_cache, loss_function):
     mixing_data_controller = MixingDataController(
         mixup_prob=mixup_prob,
         cutmix_prob=cutmix_prob,
         mixup_alpha=0.2,
         cutmix_alpha=0.2,
         cutmix_axes=[2, 3],
-        loss_function=paddle.nn.CrossEntropyLoss(),
+        loss_function=loss_function,
         metric_function=paddle.metric.accuracy,
     )
     batch_size = 16
     data_shape = (3, 224, 224)
     num_classes = 1
-    model = FakeModel(data_shape, (num_classes,))
+    model = get_fake_model(fake_model_cache, data_shape, (num_classes,))
 
-    fake_inputs = np.array(np.random.random((batch_size, *data_shape)), dtype=np.float32)
-    fake_labels = np.array(np.random.random((batch_size, num_classes)), dtype=np.int64)
-
-    if not is_numpy:
-        fake_inputs = paddle.to_tensor(fake_inputs)
-        fake_labels = paddle.to_tensor(fake_labels)
-
-    X_batch_mixed, y_batch_a, y_batch_b, lam = mixing_data_controller.mix(fake_inputs, fake_labels, is_numpy=is_numpy)
+    fake_inputs_np = _RNG.random((batch_size, *data_shape), dtype=np.float32)
+    fake_labels_np = _RNG.integers(0, num_classes, size=(batch_size, num_classes), dtype=np.int64)
+    fake_inputs = paddle.to_tensor(fake_inputs_np)
+    fake_labels = paddle.to_tensor(fake_labels_np)
 
     if is_numpy:
+        X_batch_mixed, y_batch_a, y_batch_b, lam = mixing_data_controller.mix(
+            fake_inputs_np, fake_labels_np, is_numpy=True
+        )
         X_batch_mixed = paddle.to_tensor(X_batch_mixed)
         y_batch_a = paddle.to_tensor(y_batch_a)
         y_batch_b = paddle.to_tensor(y_batch_b)
+    else:
+        X_batch_mixed, y_batch_a, y_batch_b, lam = mixing_data_controller.mix(fake_inputs, fake_labels, is_numpy=False)
 
-    predicts = model(X_batch_mixed)
-    loss = mixing_data_controller.loss(predicts, y_batch_a, y_batch_b, lam)
-    acc = mixing_data_controller.metric(predicts, y_batch_a, y_batch_b, lam)
-
-    if is_numpy:
-        fake_inputs = paddle.to_tensor(fake_inputs)
-        fake_labels = paddle.to_tensor(fake_labels)
+    with paddle.no_grad():
+        predicts = model(X_batch_mixed)
+        loss = mixing_data_controller.loss(predicts, y_batch_a, y_batch_b, lam)
+        acc = mixing_data_controller.metric(predicts, y_batch_a, y_batch_b, lam)
 
-    assert X_batch_mixed.dtype == fake_inputs.dtype
-    assert y_batch_a.dtype == y_batch_b.dtype == fake_labels.dtype
-    assert X_batch_mixed.shape == fake_inputs.shape
-    assert y_batch_a.shape == y_batch_b.shape == fake_labels.shape
+    assert_mix_invariants(X_batch_mixed, y_batch_a, y_batch_b, fake_inputs, fake_labels)
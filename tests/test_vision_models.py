@@ -2,7 +2,7 @@ import pytest
 import numpy as np
 import paddle
 
-from pptb.vision.models import googlenet, inception_v3
+from pptb.vision.models import googlenet, inception_v3, InceptionV3
 from pptb.vision.models import (
     resnext50_32x4d,
     resnext50_64x4d,
@@ -50,6 +50,50 @@ def test_inception_v3():
     assert output.shape == [batch_size, num_classes]
 
 
+def test_inception_v3_fuse():
+    batch_size = 4
+    model = InceptionV3(num_classes=10)
+    # 训练模式下前向一次，使 BN 的滑动均值与方差不再是初始值
+    model_forwards(model, data_shape=(3, 299, 299), batch_size=batch_size)
+    model.eval()
+    input = paddle.to_tensor(np.array(np.random.random((batch_size, 3, 299, 299)), dtype=np.float32))
+    output = model(input)
+    model.fuse()
+    output_fused = model(input)
+    assert np.allclose(output.numpy(), output_fused.numpy(), rtol=1e-3, atol=1e-4)
+    # 重复 fuse 不应改变模型，之后再合并 InceptionE 的非对称卷积也不应改变输出
+    model.fuse()
+    output_fused_twice = model(input)
+    assert np.allclose(output_fused.numpy(), output_fused_twice.numpy())
+    model.fuse(merge_asymmetric=True)
+    output_merged = model(input)
+    assert np.allclose(output.numpy(), output_merged.numpy(), rtol=1e-3, atol=1e-4)
+
+
+def test_inception_v3_to_static():
+    batch_size = 4
+    model = InceptionV3(num_classes=10)
+    model.eval()
+    input = paddle.to_tensor(np.array(np.random.random((batch_size, 3, 299, 299)), dtype=np.float32))
+    output = model(input)
+    model = paddle.jit.to_static(model, input_spec=[paddle.static.InputSpec([None, 3, 299, 299], "float32")])
+    output_static = model(input)
+    assert np.allclose(output.numpy(), output_static.numpy(), rtol=1e-3, atol=1e-4)
+
+
+def test_inception_v3_nhwc():
+    batch_size = 4
+    model = InceptionV3(num_classes=10)
+    model_nhwc = InceptionV3(num_classes=10, data_format="NHWC")
+    model_nhwc.set_dict(model.state_dict())
+    model.eval()
+    model_nhwc.eval()
+    input = paddle.to_tensor(np.array(np.random.random((batch_size, 3, 299, 299)), dtype=np.float32))
+    output = model(input)
+    output_nhwc = model_nhwc(paddle.transpose(input, [0, 2, 3, 1]))
+    assert np.allclose(output.numpy(), output_nhwc.numpy(), rtol=1e-3, atol=1e-4)
+
+
 def test_resnext50_32x4d():
     batch_size = 2 ** np.random.randint(3, 5)
     num_classes = np.random.randint(10, 1000)